@@ -28,7 +28,9 @@
                 const response = await fetch(url, config);
                 if (!response.ok) {
                     const error = await response.json().catch(() => ({ message: '请求失败' }));
-                    throw new Error(error.message || `HTTP ${response.status}`);
+                    const requestError = new Error(error.message || `HTTP ${response.status}`);
+                    requestError.status = response.status;
+                    throw requestError;
                 }
                 return await response.json();
             } catch (error) {
@@ -37,6 +39,19 @@
             }
         }
 
+        /**
+         * 就绪检查：嵌入模型是否已加载完成
+         * 
+         * 接口信息：
+         * - 路径: GET /ready
+         * - 返回: { ready, stages }
+         * 
+         * 服务端未提供该接口时返回404，调用方按已就绪处理
+         */
+        async getReadiness() {
+            return this.request('GET', '/ready');
+        }
+
         async getDocuments(page = 1, pageSize = 1000) {
             const params = new URLSearchParams({
                 page: page.toString(),
@@ -199,6 +214,23 @@
             }
         }
 
+        /**
+         * 输入提示：按前缀返回补全建议
+         * 
+         * 接口信息：
+         * - 路径: GET /api/v1/search/suggest?prefix=...&limit=...
+         * - 返回: { prefix, suggestions: [{ text, type, weight }] }
+         * 
+         * 服务端未提供该接口时返回404/405
+         */
+        async searchSuggest(prefix, limit = 10) {
+            const params = new URLSearchParams({
+                prefix,
+                limit: limit.toString()
+            });
+            return this.request('GET', `/api/v1/search/suggest?${params.toString()}`);
+        }
+
         async detectLanguage(text) {
             return this.request('POST', '/api/v1/nlp/detect', { body: { text } });
         }
@@ -207,6 +239,48 @@
             return this.request('POST', '/api/v1/nlp/segment', { body: { text, language } });
         }
 
+        // 以NDJSON逐行读取流式结果，每行带有序号index，按index排序后返回
+        async requestNDJSON(endpoint, body) {
+            const url = `${this.baseUrl}${endpoint}`;
+            const response = await fetch(url, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Accept': 'application/x-ndjson'
+                },
+                body: JSON.stringify(body)
+            });
+
+            if (!response.ok) {
+                const error = await response.json().catch(() => ({ message: '请求失败' }));
+                const requestError = new Error(error.message || `HTTP ${response.status}`);
+                requestError.status = response.status;
+                throw requestError;
+            }
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            const results = [];
+            let buffer = '';
+
+            const handleLine = (line) => {
+                if (!line.trim()) return;
+                results.push(JSON.parse(line));
+            };
+
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+                lines.forEach(handleLine);
+            }
+            handleLine(buffer + decoder.decode());
+
+            return results.sort((a, b) => a.index - b.index);
+        }
+
         async ragQuestion(question, options = {}) {
             console.log('[RAG-QUESTION] 开始RAG问答请求:', question, '选项:', options);
             const params = {
@@ -292,11 +366,25 @@
                 search_mode: options.search_mode || 'semantic'
             };
             
+            // 以摘要片段代替完整分块文本：结果返回snippets（[{text, highlights, prefix_truncated, suffix_truncated}]）而不返回content，
+            // highlights为[start, end)偏移，按Unicode码点计（与Python字符串下标一致）；服务端不支持时照常返回content
+            if (options.snippets) {
+                params.snippets = true;
+            }
+            
+            if (options.similarity_threshold !== undefined) {
+                params.similarity_threshold = options.similarity_threshold;
+            }
+            
             console.log('[RAG-RETRIEVE] 请求参数:', params);
             console.log('[RAG-RETRIEVE] 请求URL:', '/api/v1/rag/retrieve');
             
             try {
-                const response = await this.request('POST', '/api/v1/rag/retrieve', { body: params });
+                const response = await this.request('POST', '/api/v1/rag/retrieve', {
+                    body: params,
+                    // 中止信号：提问被中止时取消仍在进行的检索
+                    signal: options.signal
+                });
                 console.log('[RAG-RETRIEVE] 响应:', JSON.stringify(response, null, 2));
                 
                 // 记录检索结果中的文件名信息
@@ -314,6 +402,49 @@
             }
         }
 
+        /**
+         * 范围检索：返回相似度不低于similarity_threshold的全部分块，按相似度从高到低以NDJSON逐行推送
+         * 
+         * 接口信息：
+         * - 路径: POST /api/v1/rag/retrieve/range
+         * - 请求体与 ragRetrieve 相同，不需要 k
+         * - 每行一个检索结果，附带从0开始的 index
+         * 
+         * 服务端未提供该接口时返回404/405，调用方应退回 ragRetrieve
+         */
+        async ragRetrieveRange(query, options = {}) {
+            const params = {
+                query,
+                content_type: options.content_type || 'all',
+                search_mode: options.search_mode || 'semantic',
+                similarity_threshold: options.similarity_threshold,
+                snippets: options.snippets || undefined
+            };
+            
+            console.log('[RAG-RANGE] 请求参数:', params);
+            return this.requestNDJSON('/api/v1/rag/retrieve/range', params);
+        }
+
+        /**
+         * 批量获取命中分块的相邻分块上下文，用于展开检索结果时显示原文
+         * 
+         * 接口信息：
+         * - 路径: POST /api/v1/rag/chunks/context
+         * - 请求体: { chunks: [{ document_id, chunk_index }], expand_neighbors: n }
+         * - 返回: { contexts: [{ document_id, chunk_index, text, chunk_range, hit_range }] }
+         *   text为命中分块前后各n个分块去除重叠后拼接的原文，hit_range为命中分块在text中的[start, end)区间（按Unicode码点计）
+         * 
+         * 一页结果只发送一次请求；服务端未提供该接口时返回404/405
+         */
+        async getChunkContexts(chunks, expandNeighbors = 1) {
+            return this.request('POST', '/api/v1/rag/chunks/context', {
+                body: {
+                    chunks,
+                    expand_neighbors: expandNeighbors
+                }
+            });
+        }
+
         async ragServiceInfo() {
             return this.request('GET', '/api/v1/rag/info');
         }
@@ -457,7 +588,9 @@
                     'Content-Type': 'application/json',
                     'Accept': 'text/event-stream'
                 },
-                body: JSON.stringify(params)
+                body: JSON.stringify(params),
+                // 中止信号：用于在新提问、清空历史或页面卸载时取消未完成的请求
+                signal: options.signal
             });
 
             if (!response.ok) {
@@ -8,6 +8,8 @@
             this.currentModel = null;
             this.availableModels = [];
             this.ragEventsInitialized = false;
+            // 当前流式请求的中止控制器，用于在新提问、清空历史或页面卸载时取消未完成的请求
+            this.streamController = null;
             
             // 使用全局状态管理聊天历史
             this.initChatState();
@@ -110,6 +112,16 @@
             }
         }
         
+        // 中止当前提问的检索与流式请求，前端停止读取响应流
+        abortStreaming() {
+            if (this.streamController) {
+                console.log('[STREAM] 中止未完成的流式请求');
+                this.streamController.abort();
+                this.streamController = null;
+            }
+            this.setStreamingState(false);
+        }
+        
         // 获取流式状态
         getStreamingState() {
             if (window.StateManager) {
@@ -411,8 +423,8 @@
                     
                     this.log('DEBUG', '新检索结果转换完成', { newContextCount: newContext.length });
                     
-                    // 合并上下文：前端显示的上下文 + 新检索的上下文
-                    combinedContext = [...displayedContext, ...newContext];
+                    // 合并上下文：前端显示的上下文在前保持不变，新检索的上下文去重后追加
+                    combinedContext = this.mergeContext(displayedContext, newContext);
                     this.log('INFO', '上下文合并完成', {
                         displayedContextCount: displayedContext.length,
                         newContextCount: newContext.length,
@@ -493,8 +505,14 @@
                 retrievalContent.innerHTML = '<div class="empty-hint">检索中...</div>';
             }
             
+            // 新提问时中止上一个仍在生成的流式请求
+            this.abortStreaming();
+            const controller = new AbortController();
+            this.streamController = controller;
+            
             // 创建流式消息容器
             const streamingContainer = this.createStreamingMessage();
+            this.setStreamingState(true, streamingContainer);
             
             try {
                 this.log('INFO', '开始处理流式消息', { messageLength: message.length, provider: provider, modelName: modelName });
@@ -526,9 +544,17 @@
                 const retrievalResults = await this.api.ragRetrieve(message, {
                     k: k,
                     content_type: 'all',
-                    search_mode: 'intelligent'
+                    search_mode: 'intelligent',
+                    signal: controller.signal
                 });
                 
+                // 检索返回前提问已被中止（新提问或清空历史），不再用旧结果覆盖侧边栏
+                if (controller.signal.aborted) {
+                    this.log('INFO', '提问已中止，丢弃检索结果');
+                    this.markStreamingStopped(streamingContainer);
+                    return;
+                }
+                
                 this.log('DEBUG', 'ragRetrieve调用完成', {
                     hasResults: !!retrievalResults?.results,
                     resultsCount: retrievalResults?.results?.length || 0
@@ -561,7 +587,8 @@
                     // 使用chat_with_context端点
                     responseStream = await this.api.chatWithContextStream(message, combinedContext, {
                         model_provider: provider,
-                        model_name: modelName
+                        model_name: modelName,
+                        signal: controller.signal
                     });
                 } else {
                     // 将新检索结果转换为chat_with_context所需的格式
@@ -580,8 +607,8 @@
                     
                     this.log('DEBUG', '新检索结果转换完成', { newContextCount: newContext.length });
                     
-                    // 合并上下文：前端显示的上下文 + 新检索的上下文
-                    combinedContext = [...displayedContext, ...newContext];
+                    // 合并上下文：前端显示的上下文在前保持不变，新检索的上下文去重后追加
+                    combinedContext = this.mergeContext(displayedContext, newContext);
                     this.log('INFO', '上下文合并完成', {
                         displayedContextCount: displayedContext.length,
                         newContextCount: newContext.length,
@@ -591,7 +618,8 @@
                     // 使用chat_with_context端点
                     responseStream = await this.api.chatWithContextStream(message, combinedContext, {
                         model_provider: provider,
-                        model_name: modelName
+                        model_name: modelName,
+                        signal: controller.signal
                     });
                     
                     this.log('DEBUG', 'chat_with_context流式响应已获取');
@@ -601,8 +629,18 @@
                 await this.processStreamResponse(responseStream, streamingContainer, message);
                 
             } catch (error) {
+                if (error.name === 'AbortError') {
+                    this.log('INFO', '流式请求已中止');
+                    this.markStreamingStopped(streamingContainer);
+                    return;
+                }
                 this.log('ERROR', '流式处理失败', { errorMessage: error.message, stack: error.stack });
                 this.addStreamingError(streamingContainer, error.message);
+            } finally {
+                if (this.streamController === controller) {
+                    this.streamController = null;
+                    this.setStreamingState(false);
+                }
             }
         }
 
@@ -788,6 +826,21 @@
             }
         }
 
+        markStreamingStopped(container) {
+            if (container) {
+                container.classList.remove('streaming');
+                const thinkingLabel = container.querySelector('.thinking-label');
+                if (thinkingLabel) {
+                    thinkingLabel.textContent = '⏹ 已停止生成';
+                }
+                const responseContent = container.querySelector('.response-content');
+                if (responseContent && !responseContent.textContent.trim()) {
+                    responseContent.textContent = '⏹ 已停止生成';
+                    responseContent.style.display = 'block';
+                }
+            }
+        }
+
         addChatMessage(role, content, isLoading = false) {
             const chatContainer = document.getElementById('chatMessages');
             if (!chatContainer) {
@@ -967,6 +1020,7 @@
         }
 
         clearChatHistory() {
+            this.abortStreaming();
             this.chatHistory = [];
             const chatContainer = document.getElementById('chatMessages');
             if (chatContainer) {
@@ -983,6 +1037,19 @@
             return div.innerHTML;
         }
         
+        // 以追加方式合并上下文：保持已有片段的顺序不变，只追加内容未出现过的新片段
+        mergeContext(baseContext, newContext) {
+            const seen = new Set(baseContext.map(item => item.content));
+            const merged = [...baseContext];
+            for (const item of newContext) {
+                if (!seen.has(item.content)) {
+                    seen.add(item.content);
+                    merged.push(item);
+                }
+            }
+            return merged;
+        }
+        
         // 获取前端已经显示的相关文段内容作为上下文
         getDisplayedContext() {
             this.log('DEBUG', '开始提取前端显示的上下文');
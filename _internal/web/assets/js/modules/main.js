@@ -147,6 +147,8 @@
         // 可以在这里添加清理逻辑
         if (appInstance) {
             console.log('[MAIN] 清理应用实例...');
+            // 中止未完成的流式对话请求
+            appInstance.chatManager?.abortStreaming();
         }
     });
 
@@ -19,6 +19,7 @@
             this.isInitialized = false;
             this.componentsLoaded = false;
             this.eventsBound = false; // 添加标志位，确保事件只被绑定一次
+            this.readinessAvailable = true; // 后端未提供/ready时置为false，之后不再请求
         }
         
         async init() {
@@ -236,11 +237,7 @@
             const statusEl = document.getElementById('connectionStatus');
             try {
                 await this.api.getDocuments();
-                statusEl.innerHTML = `
-                    <span class="status-dot"></span>
-                    <span class="status-text">已连接</span>
-                `;
-                statusEl.classList.remove('disconnected');
+                await this.pollReadiness();
             } catch (error) {
                 statusEl.innerHTML = `
                     <span class="status-dot" style="background: #dc3545;"></span>
@@ -250,6 +247,39 @@
             }
         }
 
+        // 仅轮询就绪接口；后端未提供/ready或请求失败时按已就绪处理
+        async pollReadiness() {
+            const statusEl = document.getElementById('connectionStatus');
+            clearTimeout(this.readinessTimer);
+            let readiness = null;
+            if (this.readinessAvailable) {
+                try {
+                    readiness = await this.api.getReadiness();
+                } catch (error) {
+                    // 后端没有就绪接口时停止探测，其他错误下次检查时重试
+                    if (error.status === 404 || error.status === 405) {
+                        console.warn('[APP] 服务端未提供就绪接口，已停用');
+                        this.readinessAvailable = false;
+                    }
+                }
+            }
+            if (readiness && readiness.ready === false) {
+                statusEl.innerHTML = `
+                    <span class="status-dot" style="background: #ffc107;"></span>
+                    <span class="status-text">模型加载中</span>
+                `;
+                statusEl.classList.remove('disconnected');
+                this.readinessTimer = setTimeout(() => this.pollReadiness(), 2000);
+                return;
+            }
+            
+            statusEl.innerHTML = `
+                <span class="status-dot"></span>
+                <span class="status-text">已连接</span>
+            `;
+            statusEl.classList.remove('disconnected');
+        }
+
         bindEvents() {
             // 检查是否已经绑定过事件，避免重复绑定
             if (this.eventsBound) {
@@ -13,6 +13,10 @@
             this.currentPage = 1;
             this.pageSize = 10;
             this.totalPages = 1;
+            this.suggestAvailable = true;
+            this.rangeAvailable = true;
+            this.contextAvailable = true;
+            this.contextRequests = new Map();
         }
 
         async init() {
@@ -42,17 +46,66 @@
             if (closeDetailBtn) {
                 closeDetailBtn.addEventListener('click', () => this.closeDetail());
             }
+
+            // 搜索面板与文档生成面板的搜索框共用输入提示
+            ['searchInput', 'component-genSearchQuery'].forEach(id => {
+                const input = document.getElementById(id);
+                if (input) {
+                    this.attachTypeahead(input);
+                }
+            });
+        }
+
+        // 输入时从服务端前缀索引获取补全建议，通过datalist显示
+        attachTypeahead(input) {
+            const datalist = document.createElement('datalist');
+            datalist.id = `${input.id}-suggestions`;
+            input.insertAdjacentElement('afterend', datalist);
+            input.setAttribute('list', datalist.id);
+            input.setAttribute('autocomplete', 'off');
+
+            const fetchSuggestions = window.AppUtils.debounce(async () => {
+                const prefix = input.value.trim();
+                if (!prefix || !this.suggestAvailable) {
+                    datalist.innerHTML = '';
+                    return;
+                }
+                try {
+                    const response = await this.api.searchSuggest(prefix, 10);
+                    // 输入已变化时丢弃过期结果
+                    if (input.value.trim() !== prefix) return;
+                    const suggestions = response?.suggestions || [];
+                    datalist.replaceChildren(...suggestions.map(item => {
+                        const option = document.createElement('option');
+                        option.value = item.text;
+                        return option;
+                    }));
+                } catch (error) {
+                    // 后端没有输入提示接口时停止请求；服务未就绪等临时错误只清空本次建议
+                    if (error.status === 404 || error.status === 405) {
+                        console.warn('[SEARCH] 服务端未提供输入提示，已停用');
+                        this.suggestAvailable = false;
+                    }
+                    datalist.innerHTML = '';
+                }
+            }, 150);
+
+            input.addEventListener('input', fetchSuggestions);
         }
 
         async handleSearch() {
             const searchInput = document.getElementById('searchInput');
             const categoryFilter = document.getElementById('categoryFilter');
             const searchMode = document.getElementById('searchMode');
+            const similarityThreshold = document.getElementById('similarityThreshold');
             const searchResults = document.getElementById('searchResults');
 
             const query = searchInput.value.trim();
             const category = categoryFilter.value;
             const mode = searchMode.value;
+            const threshold = similarityThreshold && similarityThreshold.value !== ''
+                ? parseFloat(similarityThreshold.value)
+                : null;
 
             if (!query) {
                 this.toast.show('请输入搜索关键词', 'warning');
@@ -69,18 +122,12 @@
             try {
                 const startTime = Date.now();
                 
-                const response = await this.api.ragRetrieve(query, {
-                    k: 10000,
-                    content_type: 'all',
-                    search_mode: mode
-                });
+                const results = await this.retrieveAll(query, mode, threshold);
                 
                 const endTime = Date.now();
                 const searchTime = ((endTime - startTime) / 1000).toFixed(2);
 
-                console.log('[SEARCH] 搜索结果:', response);
-
-                const results = response?.results || [];
+                console.log('[SEARCH] 搜索结果:', results);
                 
                 if (results.length > 0) {
                     this.currentResults = results;
@@ -97,6 +144,42 @@
             }
         }
 
+        // 语义搜索设置了相似度阈值时使用范围检索，精确搜索或未设置阈值时保持原有的k=10000检索
+        async retrieveAll(query, mode, threshold) {
+            const options = {
+                content_type: 'all',
+                search_mode: mode,
+                snippets: true
+            };
+
+            if (mode !== 'semantic' || threshold === null) {
+                const response = await this.api.ragRetrieve(query, { ...options, k: 10000 });
+                return response?.results || [];
+            }
+
+            if (this.rangeAvailable) {
+                try {
+                    return await this.api.ragRetrieveRange(query, { ...options, similarity_threshold: threshold });
+                } catch (error) {
+                    // 仅在服务端没有该接口时停用范围检索，服务未就绪等临时错误照常抛出
+                    if (error.status !== 404 && error.status !== 405) {
+                        throw error;
+                    }
+                    console.warn('[SEARCH] 服务端未提供范围检索，改为检索后按阈值过滤');
+                    this.rangeAvailable = false;
+                }
+            }
+
+            const response = await this.api.ragRetrieve(query, {
+                ...options,
+                k: 10000,
+                similarity_threshold: threshold
+            });
+            // score为距离（相似度 = 1 - score），服务端未按阈值过滤时在前端过滤；没有score的结果无法判断，不予保留
+            return (response?.results || [])
+                .filter(result => typeof result.score === 'number' && 1 - result.score >= threshold);
+        }
+
         showLoading() {
             const searchResults = document.getElementById('searchResults');
             searchResults.innerHTML = `
@@ -140,6 +223,7 @@
             this.currentResults = results;
             this.totalPages = Math.ceil(results.length / this.pageSize);
             this.currentPage = 1;
+            this.contextRequests = new Map();
 
             this.renderResults(searchTime, totalResults, searchMode);
         }
@@ -174,7 +258,7 @@
                             </div>
                         </div>
                         <div class="result-content collapsed">
-                            ${this.escapeHtml(result.content)}
+                            ${this.renderResultText(result)}
                         </div>
                         <div class="result-meta">
                             <div class="result-meta-item" data-icon="📄">文档ID: ${result.metadata?.document_id || 'N/A'}</div>
@@ -201,17 +285,22 @@
                 const toggleBtn = item.querySelector('.toggle-btn');
                 const contentDiv = item.querySelector('.result-content');
                 
-                toggleBtn.addEventListener('click', (e) => {
+                toggleBtn.addEventListener('click', async (e) => {
                     e.stopPropagation();
                     const isExpanded = toggleBtn.dataset.expanded === 'true';
                     
+                    const result = this.currentResults[parseInt(item.dataset.index)];
+                    
                     if (isExpanded) {
+                        contentDiv.innerHTML = this.renderResultText(result);
                         contentDiv.classList.add('collapsed');
                         contentDiv.style.maxHeight = '80px';
                         toggleBtn.dataset.expanded = 'false';
                         toggleBtn.querySelector('.toggle-text').textContent = '展开';
                         toggleBtn.querySelector('.toggle-icon').innerHTML = '<polyline points="6 9 12 15 18 9"></polyline>';
                     } else {
+                        await this.ensurePageContexts();
+                        contentDiv.innerHTML = this.renderExpandedText(result);
                         contentDiv.classList.remove('collapsed');
                         contentDiv.style.maxHeight = 'none';
                         toggleBtn.dataset.expanded = 'true';
@@ -332,6 +421,108 @@
             this.renderResults('0.00', this.currentResults.length, this.searchMode);
         }
 
+        // 优先显示服务端返回的摘要片段，按高亮偏移标记匹配词；旧接口无snippets时显示完整内容
+        renderResultText(result) {
+            if (!Array.isArray(result.snippets) || result.snippets.length === 0) {
+                return this.escapeHtml(result.content);
+            }
+
+            return result.snippets.map(snippet => {
+                // 偏移按Unicode码点计，先按码点拆分再截取，避免补充平面字符（如emoji、扩展汉字）导致高亮错位
+                const chars = Array.from(snippet.text || '');
+                const slice = (start, end) => this.escapeHtml(chars.slice(start, end).join(''));
+                // 重叠或相接的高亮区间先合并，避免部分匹配未被标记
+                const highlights = [];
+                [...(snippet.highlights || [])].sort((a, b) => a[0] - b[0]).forEach(([start, end]) => {
+                    const last = highlights[highlights.length - 1];
+                    if (last && start <= last[1]) {
+                        last[1] = Math.max(last[1], end);
+                    } else {
+                        highlights.push([start, end]);
+                    }
+                });
+                let html = snippet.prefix_truncated ? '…' : '';
+                let cursor = 0;
+
+                highlights.forEach(([start, end]) => {
+                    html += slice(cursor, start);
+                    html += `<mark>${slice(start, end)}</mark>`;
+                    cursor = end;
+                });
+                html += slice(cursor);
+                if (snippet.suffix_truncated) html += '…';
+
+                return html;
+            }).join('<br>');
+        }
+
+        // 首次展开时为当前页的全部结果批量获取相邻分块上下文（单次请求），结果缓存在result.context上；
+        // 请求未返回时再次展开同一页会等待同一个请求，不重复发送
+        ensurePageContexts() {
+            if (!this.contextAvailable) return Promise.resolve();
+
+            const requests = this.contextRequests;
+            const key = `${this.currentPage}:${this.pageSize}`;
+            if (!requests.has(key)) {
+                const request = this.fetchPageContexts().finally(() => {
+                    if (requests.get(key) === request) {
+                        requests.delete(key);
+                    }
+                });
+                requests.set(key, request);
+            }
+            return requests.get(key);
+        }
+
+        async fetchPageContexts() {
+            const startIndex = (this.currentPage - 1) * this.pageSize;
+            const pending = this.currentResults
+                .slice(startIndex, startIndex + this.pageSize)
+                .filter(result => result.context === undefined
+                    && result.metadata?.document_id != null
+                    && result.metadata?.chunk_index != null);
+            if (pending.length === 0) return;
+
+            const keyOf = (documentId, chunkIndex) => `${documentId}:${chunkIndex}`;
+            try {
+                const response = await this.api.getChunkContexts(pending.map(result => ({
+                    document_id: result.metadata.document_id,
+                    chunk_index: result.metadata.chunk_index
+                })), 1);
+                const contexts = new Map((response?.contexts || [])
+                    .map(context => [keyOf(context.document_id, context.chunk_index), context]));
+                pending.forEach(result => {
+                    result.context = contexts.get(keyOf(result.metadata.document_id, result.metadata.chunk_index)) || null;
+                });
+            } catch (error) {
+                // 服务端没有该接口时停止请求，其他错误下次展开时重试
+                if (error.status === 404 || error.status === 405) {
+                    console.warn('[SEARCH] 服务端未提供相邻分块上下文，展开时显示分块原文');
+                    this.contextAvailable = false;
+                } else {
+                    console.warn('[SEARCH] 获取相邻分块上下文失败:', error.message);
+                }
+            }
+        }
+
+        // 展开时显示相邻分块合并后的原文上下文，命中分块所在区间加粗；
+        // 无上下文时显示旧接口返回的分块内容，snippets模式下没有content则继续显示摘要
+        renderExpandedText(result) {
+            const context = result.context;
+            if (!context || !context.text) {
+                return result.content ? this.escapeHtml(result.content) : this.renderResultText(result);
+            }
+
+            const [hitStart, hitEnd] = context.hit_range || [0, 0];
+            if (hitEnd <= hitStart) {
+                return this.escapeHtml(context.text);
+            }
+
+            const chars = Array.from(context.text);
+            const slice = (start, end) => this.escapeHtml(chars.slice(start, end).join(''));
+            return slice(0, hitStart) + `<strong>${slice(hitStart, hitEnd)}</strong>` + slice(hitEnd);
+        }
+
         escapeHtml(text) {
             if (!text) return '';
             const div = document.createElement('div');